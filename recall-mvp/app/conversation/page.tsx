@@ -395,15 +395,15 @@ export default function ActiveConversationPage() {
           />
         )}
 
-        {/* Toast Notification */}
-        {toastMessage && (
-          <div className="absolute top-24 left-1/2 -translate-x-1/2 z-50 animate-fade-in-down w-[90%] md:w-auto text-center">
-            <div className="bg-terracotta text-white px-6 py-3 rounded-full shadow-2xl font-bold flex items-center justify-center gap-2 transition-all duration-300">
-              <span className="material-symbols-outlined filled">check_circle</span>
+        {/* Toast Notification - live region stays mounted so screen readers announce new messages */}
+        <div role="status" className="absolute top-24 left-1/2 -translate-x-1/2 z-50 w-[90%] md:w-auto text-center">
+          {toastMessage && (
+            <div className="animate-fade-in-down bg-terracotta text-white px-6 py-3 rounded-full shadow-2xl font-bold flex items-center justify-center gap-2 transition-all duration-300">
+              <span className="material-symbols-outlined filled" aria-hidden="true">check_circle</span>
               {toastMessage}
             </div>
-          </div>
-        )}
+          )}
+        </div>
 
         {/* Main Content Area - Flexbox for proper height distribution */}
         <div className="flex-1 flex flex-col items-center px-0 md:px-4 pt-0 md:pt-4 pb-0 md:pb-6 overflow-hidden">
@@ -462,6 +462,7 @@ export default function ActiveConversationPage() {
 
                   <button
                     onClick={handleEndSession}
+                    aria-label="End session"
                     className="flex items-center gap-2 px-4 py-2 bg-red-50 hover:bg-red-100 text-red-600 rounded-full transition-colors text-xs font-bold uppercase tracking-wider group"
                   >
                     <span>End</span>
@@ -470,7 +471,11 @@ export default function ActiveConversationPage() {
                 </div>
 
                 {/* Messages Area */}
-                <div className="flex-grow overflow-y-auto px-6 py-6 md:px-10 scroll-smooth space-y-6 relative bg-gradient-to-b from-white to-peach-main/5">
+                <div
+                  role="log"
+                  aria-label="Conversation transcript"
+                  className="flex-grow overflow-y-auto px-6 py-6 md:px-10 scroll-smooth space-y-6 relative bg-gradient-to-b from-white to-peach-main/5"
+                >
                   {transcript.length === 0 && (
                     <div className="absolute inset-0 flex flex-col items-center justify-center opacity-40 pointer-events-none">
                       <span className="material-symbols-outlined text-8xl text-peach-main/30 mb-4">forum</span>
@@ -484,6 +489,7 @@ export default function ActiveConversationPage() {
                       text={msg.text}
                       isAI={msg.speaker === 'agent'}
                       timestamp={i === transcript.length - 1 ? 'Just now' : undefined}
+                      testId={i === 0 && msg.speaker === 'agent' ? 'greeting' : undefined}
                     />
                   ))}
 
@@ -506,6 +512,8 @@ export default function ActiveConversationPage() {
                       onClick={() => setShowTextInput(!showTextInput)}
                       className={`p-3 md:p-4 rounded-full transition-colors active:scale-95 ${showTextInput ? 'bg-terracotta text-white' : 'text-text-muted hover:bg-slate-50'}`}
                       title="Type message"
+                      aria-label="Type message"
+                      aria-expanded={showTextInput}
                     >
                       <span className="material-symbols-outlined text-2xl">keyboard</span>
                     </button>
@@ -533,6 +541,8 @@ export default function ActiveConversationPage() {
 
                       <button
                         onClick={toggleListening}
+                        data-testid="mic-toggle"
+                        aria-label={isListening ? 'Stop recording' : 'Start recording'}
                         className={`
                            relative w-20 h-20 md:w-24 md:h-24 rounded-full flex items-center justify-center shadow-2xl transition-all duration-300 transform active:scale-95 border-4 
                            ${isListening
@@ -10,6 +10,16 @@ interface ChapterData {
     createdAt: string;
 }
 
+// Chapter content is user-generated; escape it before the markdown pass injects <em> tags.
+function escapeHtml(text: string): string {
+    return text
+        .replace(/&/g, '&amp;')
+        .replace(/</g, '&lt;')
+        .replace(/>/g, '&gt;')
+        .replace(/"/g, '&quot;')
+        .replace(/'/g, '&#39;');
+}
+
 export default function BookPage({ params }: { params: Promise<{ id: string }> }) {
     const resolvedParams = use(params);
     const [story, setStory] = useState<ChapterData | null>(null);
@@ -105,7 +115,7 @@ export default function BookPage({ params }: { params: Promise<{ id: string }> }
                         <div className="flex justify-center mb-8">
                             <div className="w-24 h-1 bg-stone-300 rounded-full" />
                         </div>
-                        <h1 className="font-serif text-4xl md:text-5xl font-bold text-stone-900 mb-4 leading-tight">
+                        <h1 data-testid="chapter-title" className="font-serif text-4xl md:text-5xl font-bold text-stone-900 mb-4 leading-tight">
                             {story.title || 'A Family Memory'}
                         </h1>
                         <p className="text-stone-500 font-serif italic text-lg">
@@ -117,7 +127,7 @@ export default function BookPage({ params }: { params: Promise<{ id: string }> }
                     </div>
 
                     {/* Story Content */}
-                    <div className="font-serif text-lg md:text-xl text-stone-800 leading-relaxed space-y-6">
+                    <div data-testid="chapter-content" className="font-serif text-lg md:text-xl text-stone-800 leading-relaxed space-y-6">
                         {story.content?.split('\n\n').map((paragraph, idx) => {
                             // Handle markdown-style headers
                             if (paragraph.startsWith('## ')) {
@@ -128,7 +138,7 @@ export default function BookPage({ params }: { params: Promise<{ id: string }> }
                                 );
                             }
                             // Handle emphasized text (italic)
-                            const processedText = paragraph.replace(/\*([^*]+)\*/g, '<em>$1</em>');
+                            const processedText = escapeHtml(paragraph).replace(/\*([^*]+)\*/g, '<em>$1</em>');
                             return (
                                 <p
                                     key={idx}
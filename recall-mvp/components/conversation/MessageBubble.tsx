@@ -8,11 +8,13 @@ interface MessageBubbleProps {
     isAI: boolean;
     timestamp?: string;
     isStreaming?: boolean;
+    testId?: string;
 }
 
-export function MessageBubble({ text, isAI, timestamp, isStreaming }: MessageBubbleProps) {
+export function MessageBubble({ text, isAI, timestamp, isStreaming, testId }: MessageBubbleProps) {
     return (
         <motion.div
+            data-testid={testId}
             initial={{ opacity: 0, y: 10, scale: 0.98 }}
             animate={{ opacity: 1, y: 0, scale: 1 }}
             transition={{ duration: 0.3, ease: "easeOut" }}
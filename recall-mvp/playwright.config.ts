@@ -15,8 +15,33 @@ export default defineConfig({
   projects: [
     {
       name: 'chromium',
+      testIgnore: /verification\//,
       use: { ...devices['Desktop Chrome'] },
     },
+    {
+      // Compiles the dev-server routes the verification specs visit before their short timeouts apply
+      name: 'verification-setup',
+      testDir: './tests/e2e/verification',
+      testMatch: /warmup\.setup\.ts/,
+    },
+    {
+      // Mocked accessibility/audio/XSS checks; context/page reuse lives in verification/fixtures.ts
+      name: 'verification',
+      testDir: './tests/e2e/verification',
+      dependencies: ['verification-setup'],
+      use: {
+        launchOptions: {
+          args: [
+            // Fake media flags let the AudioPipeline acquire a microphone without a device or a prompt
+            '--use-fake-ui-for-media-stream',
+            '--use-fake-device-for-media-stream',
+          ],
+        },
+        permissions: ['microphone'],
+        // MSW's worker (NEXT_PUBLIC_USE_MOCKS) would answer requests before the specs' routes see them
+        serviceWorkers: 'block',
+      },
+    },
   ],
   webServer: {
     command: 'npm run dev',
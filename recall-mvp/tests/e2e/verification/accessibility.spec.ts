@@ -0,0 +1,26 @@
+import { test, expect, attachScreenshot, mockConversation } from './fixtures';
+
+test('conversation controls expose accessible names and state', async ({ page }) => {
+    await mockConversation(page);
+    await page.goto('/conversation');
+
+    const endButton = page.getByRole('button', { name: 'End session' });
+    const typeButton = page.getByRole('button', { name: 'Type message' });
+    const micButton = page.getByRole('button', { name: 'Start recording' });
+    const transcriptArea = page.getByRole('log', { name: 'Conversation transcript' });
+
+    // Independent checks on already-mounted controls: poll them concurrently
+    await Promise.all([
+        expect(endButton).toBeVisible(),
+        expect(typeButton).toBeVisible(),
+        expect(typeButton).toHaveAttribute('aria-expanded', 'false'),
+        expect(micButton).toBeVisible(),
+        expect(transcriptArea).toBeVisible(),
+    ]);
+
+    // Opening the text input must be reflected in the toggle's state
+    await typeButton.click();
+    await expect(typeButton).toHaveAttribute('aria-expanded', 'true');
+
+    await attachScreenshot(page, 'accessibility_check');
+});
@@ -0,0 +1,44 @@
+import { errors } from '@playwright/test';
+import { test, expect, attachScreenshot, mockConversation } from './fixtures';
+
+const MAX_CONSOLE_LINES = 200;
+
+test('microphone button switches the page into the listening state', async ({ page }) => {
+    // Dev builds are chatty; keep the tail of the console and only dump it on failure
+    const consoleLines: string[] = [];
+    page.on('console', msg => {
+        consoleLines.push(msg.text());
+        if (consoleLines.length > MAX_CONSOLE_LINES) consoleLines.shift();
+    });
+    const dumpConsole = () => console.log(consoleLines.join('\n'));
+
+    await mockConversation(page);
+    await page.goto('/conversation');
+    await expect(page.getByTestId('greeting')).toBeVisible();
+
+    // click() auto-waits, so a timeout doubles as the "button missing" check
+    try {
+        await page.locator('button[aria-label="Start recording"]').click({ timeout: 3000 });
+    } catch (error) {
+        if (!(error instanceof errors.TimeoutError)) throw error;
+        dumpConsole();
+        await attachScreenshot(page, 'error_state');
+        throw new Error('Start button not found.');
+    }
+
+    const micButton = page.getByTestId('mic-toggle');
+    try {
+        await expect(micButton).toHaveAttribute('aria-label', 'Stop recording', { timeout: 5000 });
+    } catch (error) {
+        // Pipeline failures replace the toast; the warm-up one is always there because mockConversation forces it
+        const toastText = (await page.getByRole('status').textContent())?.trim();
+        if (toastText && !toastText.includes('Warm-up checks:')) {
+            console.log(`Toast: ${toastText}`);
+        }
+        dumpConsole();
+        await attachScreenshot(page, 'failed_click');
+        throw error;
+    }
+
+    await attachScreenshot(page, 'listening_state');
+});
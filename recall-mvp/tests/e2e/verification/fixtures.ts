@@ -0,0 +1,103 @@
+import { test as base, expect, type BrowserContext, type Page } from '@playwright/test';
+
+/**
+ * Shared fixtures for the browser verification specs (accessibility, audio, XSS).
+ *
+ * Launch flags, permissions and service-worker blocking come from the
+ * `verification` project in playwright.config.ts. Playwright already shares one
+ * browser per worker; on top of that one context and page are created per
+ * worker and reused by every spec. Between tests the page is sent back to
+ * about:blank and routes, listeners and cookies are cleared, which is far
+ * cheaper than a cold context.
+ */
+
+type VerificationFixtures = {
+    /** Serves `body` as JSON for /api/chapters/detail/:chapterId on every page in the test's context. */
+    mockChapter: (chapterId: string, body: Buffer) => Promise<void>;
+};
+
+type VerificationWorkerFixtures = {
+    sharedContext: BrowserContext;
+    sharedPage: Page;
+};
+
+const JSON_HEADERS = { 'content-type': 'application/json' };
+
+// The specs assert DOM structure and text only, so these never need to hit the network.
+const BLOCKED_RESOURCE_TYPES = new Set(['image', 'font', 'media']);
+
+export const test = base.extend<VerificationFixtures, VerificationWorkerFixtures>({
+    // Worker-scoped, so it cannot depend on the test-scoped option fixtures; read them from the project
+    sharedContext: [async ({ browser }, use, workerInfo) => {
+        const { baseURL, permissions, serviceWorkers } = workerInfo.project.use;
+        const context = await browser.newContext({ baseURL, permissions, serviceWorkers });
+        // Everything is mocked locally, so fail fast instead of idling for minutes in CI
+        context.setDefaultTimeout(5000);
+        context.setDefaultNavigationTimeout(10000);
+        await use(context);
+        await context.close();
+    }, { scope: 'worker' }],
+
+    sharedPage: [async ({ sharedContext }, use) => {
+        await use(await sharedContext.newPage());
+    }, { scope: 'worker' }],
+
+    context: async ({ sharedContext }, use) => {
+        // Registered first, so per-test mocks added later still take precedence
+        await sharedContext.route('**/*', route => BLOCKED_RESOURCE_TYPES.has(route.request().resourceType())
+            ? route.abort()
+            : route.fallback());
+        await use(sharedContext);
+        await sharedContext.unrouteAll({ behavior: 'ignoreErrors' });
+        await sharedContext.clearCookies();
+    },
+
+    // Depends on context so its per-test setup and reset also run for specs that only ask for page
+    page: async ({ context, sharedPage }, use) => {
+        await use(sharedPage);
+        await sharedPage.removeAllListeners();
+        await sharedPage.unrouteAll({ behavior: 'ignoreErrors' });
+        await sharedPage.goto('about:blank');
+    },
+
+    mockChapter: async ({ context }, use) => {
+        await use(async (chapterId, body) => {
+            await context.route(`**/api/chapters/detail/${chapterId}`, route => route.fulfill({
+                status: 200,
+                body,
+                headers: JSON_HEADERS,
+            }));
+        });
+    },
+});
+
+export { expect };
+
+/**
+ * Captures the page and hands the image to the reporter as an attachment,
+ * so specs never block on writing screenshot files themselves. These are only
+ * glanced at when a run fails, so a low-quality JPEG is plenty.
+ */
+export async function attachScreenshot(page: Page, name: string, options: { fullPage?: boolean } = {}) {
+    const body = await page.screenshot({ type: 'jpeg', quality: 40, fullPage: options.fullPage });
+    await test.info().attach(name, { body, contentType: 'image/jpeg' });
+}
+
+/**
+ * Stubs the APIs the conversation page needs to reach the recording phase
+ * without a backend: an authenticated senior named Arthur, a session, and a greeting.
+ */
+export async function mockConversation(page: Page) {
+    await page.route('**/api/users/profile', route => route.fulfill({
+        json: { userId: 'user-arthur', name: 'Arthur', role: 'senior' },
+    }));
+    await page.route('**/api/sessions/start', route => route.fulfill({
+        json: { sessionId: 'session-verify' },
+    }));
+    // Failing the ElevenLabs warm-up drops the page straight into the recording phase.
+    await page.route('**/api/conversation/warmup', route => route.fulfill({ status: 503 }));
+    await page.route('**/api/chat/welcome', route => route.fulfill({
+        json: { greeting: 'Hello Arthur! What story would you like to share today?' },
+    }));
+    await page.route('**/api/chat/text-to-speech', route => route.abort());
+}
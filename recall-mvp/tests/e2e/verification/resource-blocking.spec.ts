@@ -0,0 +1,13 @@
+import { test, expect } from './fixtures';
+
+// Only asks for page, so it also covers the page-only path through the context fixture
+test('verification context blocks image/font/media requests', async ({ page, baseURL }) => {
+    const imageUrl = new URL('/favicon.ico?blocked', baseURL).href;
+
+    const [blockedImage] = await Promise.all([
+        page.waitForEvent('requestfailed', request => request.url() === imageUrl),
+        page.evaluate(src => { new Image().src = src; }, imageUrl),
+    ]);
+    expect(blockedImage.resourceType()).toBe('image');
+    expect(blockedImage.failure()).not.toBeNull();
+});
@@ -0,0 +1,13 @@
+import { test as setup, expect } from '@playwright/test';
+
+// `npm run dev` compiles each route on its first request, which can outlast the
+// verification specs' 10s navigation timeout. Request every page they visit up front.
+const ROUTES = ['/conversation', '/stories/warmup/book'];
+
+setup('compile the verified routes', async ({ request }) => {
+    setup.setTimeout(120000);
+    await Promise.all(ROUTES.map(async route => {
+        const response = await request.get(route, { timeout: 120000 });
+        expect(response.ok()).toBeTruthy();
+    }));
+});
@@ -0,0 +1,58 @@
+import { test, expect, attachScreenshot } from './fixtures';
+
+const MALICIOUS_CONTENT = '<img src=x onerror=alert(1)>';
+
+// Mocked responses are serialized once; the handlers may fire again on refetch
+const PAYLOAD_CHAPTER_BODY = Buffer.from(JSON.stringify({
+    id: '1',
+    title: 'Test Chapter',
+    content: MALICIOUS_CONTENT,
+    createdAt: '2023-01-01',
+}));
+const MARKDOWN_CHAPTER_BODY = Buffer.from(JSON.stringify({
+    id: 'test-id',
+    title: 'XSS Verification Story',
+    content: "This is *italic* text.\n\n<script>alert('XSS')</script>",
+    createdAt: '2023-01-01',
+}));
+
+test.describe('Book page XSS escaping', () => {
+
+    test('renders an HTML payload in chapter content as text', async ({ page, mockChapter }) => {
+        await mockChapter('1', PAYLOAD_CHAPTER_BODY);
+
+        const dialogs: string[] = [];
+        page.on('dialog', async dialog => {
+            dialogs.push(dialog.message());
+            await dialog.dismiss();
+        });
+
+        await page.goto('/stories/1/book', { waitUntil: 'domcontentloaded' });
+
+        const paragraph = page.getByTestId('chapter-content').locator('p');
+        await Promise.all([
+            expect(page.getByTestId('chapter-title')).toBeVisible(),
+            expect(paragraph).toBeVisible(),
+        ]);
+        expect(await paragraph.textContent()).toContain(MALICIOUS_CONTENT);
+        expect(dialogs).toEqual([]);
+
+        await attachScreenshot(page, 'verification');
+    });
+
+    test('escapes script tags while keeping markdown emphasis', async ({ page, mockChapter }) => {
+        await mockChapter('test-id', MARKDOWN_CHAPTER_BODY);
+
+        await page.goto('/stories/test-id/book', { waitUntil: 'domcontentloaded' });
+
+        // Poll all three rendered checks in a single in-page evaluation
+        await page.waitForFunction(({ title, script }) => {
+            const find = (selector: string, text: string) =>
+                Array.from(document.querySelectorAll<HTMLElement>(selector)).find(el => el.textContent?.includes(text));
+            return [find('h1', title), find('em', 'italic'), find('p', script)]
+                .every(el => el !== undefined && el.offsetParent !== null);
+        }, { title: 'XSS Verification Story', script: "<script>alert('XSS')</script>" });
+
+        await attachScreenshot(page, 'xss_verification', { fullPage: true });
+    });
+});